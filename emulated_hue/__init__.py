@@ -37,7 +37,7 @@ class HueEmulator:
         await self._web.async_setup()
         self.ctl.loop.create_task(async_setup_discovery(self.ctl.config_instance))
         # remove legacy light_ids config
-        if await self.ctl.config_instance.async_get_storage_value("light_ids"):
+        if self.ctl.config_instance.get_storage_value("light_ids"):
             await self.ctl.config_instance.async_delete_storage_value("light_ids")
 
         # TODO: periodic search for renamed/deleted entities/areas
@@ -168,16 +168,7 @@ class HueApiV1Endpoints:
         # enable all disabled lights and groups
         for entity_id in self.ctl.controller_hass.get_entities():
             # pre-filter based on label_filter
-            hass_state = self.ctl.controller_hass.get_entity_state(entity_id)
-            device_id = self.ctl.controller_hass.get_device_id_from_entity_id(entity_id)
-            device_attrs = (
-                self.ctl.controller_hass.get_device_attributes(device_id)
-                if device_id
-                else {}
-            )
-            if not matches_label_filter(
-                self.ctl.config_instance.label_filter, device_attrs, hass_state
-            ):
+            if not self.__entity_matches_filter(entity_id):
                 LOGGER.debug(
                     "Skipping entity %s - does not match label_filter=%s",
                     entity_id,
@@ -198,9 +189,7 @@ class HueApiV1Endpoints:
                 )
                 # add to new_lights for the app to show a special badge
                 self._new_lights[light_id] = await self.__async_entity_to_hue(entity_id)
-        groups = await self.ctl.config_instance.async_get_storage_value(
-            "groups", default={}
-        )
+        groups = self.ctl.config_instance.get_storage_value("groups", default={})
         for group_id, group_conf in groups.items():
             if "enabled" in group_conf and not group_conf["enabled"]:
                 group_conf["enabled"] = True
@@ -220,16 +209,7 @@ class HueApiV1Endpoints:
             light_id
         )
         # Enforce label filter: do not expose lights that don't match
-        hass_state = self.ctl.controller_hass.get_entity_state(entity_id)
-        device_id = self.ctl.controller_hass.get_device_id_from_entity_id(entity_id)
-        device_attrs = (
-            self.ctl.controller_hass.get_device_attributes(device_id)
-            if device_id
-            else {}
-        )
-        if not matches_label_filter(
-            self.ctl.config_instance.label_filter, device_attrs, hass_state
-        ):
+        if not self.__entity_matches_filter(entity_id):
             LOGGER.debug("Light %s hidden by label_filter", entity_id)
             return send_error_response(request.path, "resource, {path}, not available", 3)
 
@@ -246,16 +226,7 @@ class HueApiV1Endpoints:
             light_id
         )
         # Enforce label filter on control operations
-        hass_state = self.ctl.controller_hass.get_entity_state(entity_id)
-        device_id = self.ctl.controller_hass.get_device_id_from_entity_id(entity_id)
-        device_attrs = (
-            self.ctl.controller_hass.get_device_attributes(device_id)
-            if device_id
-            else {}
-        )
-        if not matches_label_filter(
-            self.ctl.config_instance.label_filter, device_attrs, hass_state
-        ):
+        if not self.__entity_matches_filter(entity_id):
             LOGGER.debug("Control blocked for %s by label_filter", entity_id)
             return send_error_response(request.path, "resource, {path}, not available", 3)
 
@@ -296,12 +267,10 @@ class HueApiV1Endpoints:
         username = request.match_info["username"]
         # instead of directly getting groups should have a property
         # get groups instead so we can easily modify it
-        group_conf = await self.ctl.config_instance.async_get_storage_value(
-            "groups", group_id
-        )
+        group_conf = self.ctl.config_instance.get_storage_value("groups", group_id)
         if group_id == "0" and "scene" in request_data:
             # scene request
-            scene = await self.ctl.config_instance.async_get_storage_value(
+            scene = self.ctl.config_instance.get_storage_value(
                 "scenes", request_data["scene"], default={}
             )
             for light_id, light_state in scene["lightstates"].items():
@@ -344,9 +313,7 @@ class HueApiV1Endpoints:
         """Handle requests to update a group."""
         group_id = request.match_info["group_id"]
         username = request.match_info["username"]
-        group_conf = await self.ctl.config_instance.async_get_storage_value(
-            "groups", group_id
-        )
+        group_conf = self.ctl.config_instance.get_storage_value("groups", group_id)
         if not group_conf:
             return send_error_response(request.path, "no group config", 404)
         update_dict(group_conf, request_data)
@@ -389,9 +356,7 @@ class HueApiV1Endpoints:
         """Handle requests to update a light."""
         light_id = request.match_info["light_id"]
         username = request.match_info["username"]
-        light_conf = await self.ctl.config_instance.async_get_storage_value(
-            "lights", light_id
-        )
+        light_conf = self.ctl.config_instance.get_storage_value("lights", light_id)
         if not light_conf:
             return send_error_response(request.path, "no light config", 404)
         if "name" in request_data:
@@ -400,18 +365,7 @@ class HueApiV1Endpoints:
             )
             entity_id = light_conf["entity_id"]
             # Enforce label filter for updates
-            hass_state = self.ctl.controller_hass.get_entity_state(entity_id)
-            device_id = self.ctl.controller_hass.get_device_id_from_entity_id(
-                entity_id
-            )
-            device_attrs = (
-                self.ctl.controller_hass.get_device_attributes(device_id)
-                if device_id
-                else {}
-            )
-            if not matches_label_filter(
-                self.ctl.config_instance.label_filter, device_attrs, hass_state
-            ):
+            if not self.__entity_matches_filter(entity_id):
                 LOGGER.debug("Update blocked for %s by label_filter", entity_id)
                 return send_error_response(
                     request.path, "resource, {path}, not available", 3
@@ -425,9 +379,7 @@ class HueApiV1Endpoints:
     async def async_get_localitems(self, request: web.Request):
         """Handle requests to retrieve localitems (e.g. scenes)."""
         itemtype = request.match_info["itemtype"]
-        result = await self.ctl.config_instance.async_get_storage_value(
-            itemtype, default={}
-        )
+        result = self.ctl.config_instance.get_storage_value(itemtype, default={})
         return send_json_response(result)
 
     @routes.get("/api/{username}/{itemtype:(?:scenes|rules|resourcelinks)}/{item_id}")
@@ -436,7 +388,7 @@ class HueApiV1Endpoints:
         """Handle requests to retrieve info for a single localitem."""
         item_id = request.match_info["item_id"]
         itemtype = request.match_info["itemtype"]
-        items = await self.ctl.config_instance.async_get_storage_value(itemtype)
+        items = self.ctl.config_instance.get_storage_value(itemtype)
         result = items.get(item_id, {})
         return send_json_response(result)
 
@@ -455,9 +407,7 @@ class HueApiV1Endpoints:
         item_id = request.match_info["item_id"]
         itemtype = request.match_info["itemtype"]
         username = request.match_info["username"]
-        local_item = await self.ctl.config_instance.async_get_storage_value(
-            itemtype, item_id
-        )
+        local_item = self.ctl.config_instance.get_storage_value(itemtype, item_id)
         if not local_item:
             return send_error_response(request.path, "no localitem", 404)
         update_dict(local_item, request_data)
@@ -509,9 +459,7 @@ class HueApiV1Endpoints:
 
     async def async_scene_to_full_state(self) -> dict:
         """Return scene data, removing lightstates and adds group lights instead."""
-        scenes = await self.ctl.config_instance.async_get_storage_value(
-            "scenes", default={}
-        )
+        scenes = self.ctl.config_instance.get_storage_value("scenes", default={})
         scenes = copy.deepcopy(scenes)
         for _scene_num, scene_data in scenes.items():
             scenes_group = scene_data["group"]
@@ -526,14 +474,12 @@ class HueApiV1Endpoints:
         """Return full state view of emulated hue."""
         json_response = {
             "config": await self.__async_get_bridge_config(True),
-            "schedules": await self.ctl.config_instance.async_get_storage_value(
+            "schedules": self.ctl.config_instance.get_storage_value(
                 "schedules", default={}
             ),
-            "rules": await self.ctl.config_instance.async_get_storage_value(
-                "rules", default={}
-            ),
+            "rules": self.ctl.config_instance.get_storage_value("rules", default={}),
             "scenes": await self.async_scene_to_full_state(),
-            "resourcelinks": await self.ctl.config_instance.async_get_storage_value(
+            "resourcelinks": self.ctl.config_instance.get_storage_value(
                 "resourcelinks", default={}
             ),
             "lights": await self.__async_get_all_lights(),
@@ -752,7 +698,7 @@ class HueApiV1Endpoints:
             "uniqueid": device.unique_id,
             "swupdate": {
                 "state": "noupdates",
-                "lastinstall": datetime.datetime.now().isoformat().split(".")[0],
+                "lastinstall": datetime.datetime.now().isoformat(timespec="seconds"),
             },
             "config": {
                 "config": {
@@ -856,21 +802,24 @@ class HueApiV1Endpoints:
 
         return retval
 
+    def __entity_matches_filter(self, entity_id: str) -> bool:
+        """Return if the entity (or its device) matches the configured label filter."""
+        controller_hass = self.ctl.controller_hass
+        hass_state = controller_hass.get_entity_state(entity_id)
+        device_id = controller_hass.get_device_id_from_entity_id(entity_id)
+        device_attrs = (
+            controller_hass.get_device_attributes(device_id) if device_id else {}
+        )
+        return matches_label_filter(
+            self.ctl.config_instance.label_filter, device_attrs, hass_state
+        )
+
     async def __async_get_all_lights(self) -> dict:
         """Create a dict of all lights."""
         result = {}
         for entity_id in self.ctl.controller_hass.get_entities():
             # quick pre-filter: check if entity matches label filter before creating device
-            hass_state = self.ctl.controller_hass.get_entity_state(entity_id)
-            device_id = self.ctl.controller_hass.get_device_id_from_entity_id(entity_id)
-            device_attrs = (
-                self.ctl.controller_hass.get_device_attributes(device_id)
-                if device_id
-                else {}
-            )
-            if not matches_label_filter(
-                self.ctl.config_instance.label_filter, device_attrs, hass_state
-            ):
+            if not self.__entity_matches_filter(entity_id):
                 continue
 
             device = await async_get_device(self.ctl, entity_id)
@@ -883,9 +832,7 @@ class HueApiV1Endpoints:
         self, data: Any, itemtype: str = "scenes"
     ) -> str:
         """Create item in storage of given type (scenes etc.)."""
-        local_items = await self.ctl.config_instance.async_get_storage_value(
-            itemtype, default={}
-        )
+        local_items = self.ctl.config_instance.get_storage_value(itemtype, default={})
         # get first available id
         for i in range(1, 1000):
             item_id = str(i)
@@ -903,11 +850,28 @@ class HueApiV1Endpoints:
     async def __async_get_all_groups(self) -> dict:
         """Create a dict of all groups."""
         result = {}
+        # lights may be shared between local groups, check each one only once
+        hass_entity_ids = set(self.ctl.controller_hass.get_entities())
+        lights = self.ctl.config_instance.get_storage_value("lights", default={})
+        lid_to_entity = {
+            light_id: light_conf.get("entity_id")
+            for light_id, light_conf in lights.items()
+        }
 
         # local groups first
-        groups = await self.ctl.config_instance.async_get_storage_value(
-            "groups", default={}
-        )
+        groups = self.ctl.config_instance.get_storage_value("groups", default={})
+        # only match the entities local groups actually reference
+        referenced_entity_ids = {
+            lid_to_entity.get(light_id)
+            for group_conf in groups.values()
+            if "area_id" not in group_conf
+            for light_id in group_conf.get("lights") or ()
+        }
+        matching_entity_ids = {
+            entity_id
+            for entity_id in referenced_entity_ids & hass_entity_ids
+            if self.__entity_matches_filter(entity_id)
+        }
         for group_id, group_conf in groups.items():
             # no area_id = not hass area
             if "area_id" not in group_conf:
@@ -922,23 +886,11 @@ class HueApiV1Endpoints:
                 if "lights" in filtered_group and isinstance(filtered_group["lights"], list):
                     new_lights = []
                     for light_id in filtered_group["lights"]:
-                        try:
-                            entity_id = await self.ctl.config_instance.async_entity_id_from_light_id(
-                                light_id
-                            )
-                        except Exception:
+                        entity_id = lid_to_entity.get(light_id)
+                        if entity_id not in hass_entity_ids:
                             # invalid mapping, skip
                             continue
-                        hass_state = self.ctl.controller_hass.get_entity_state(entity_id)
-                        device_id = self.ctl.controller_hass.get_device_id_from_entity_id(entity_id)
-                        device_attrs = (
-                            self.ctl.controller_hass.get_device_attributes(device_id)
-                            if device_id
-                            else {}
-                        )
-                        if matches_label_filter(
-                            self.ctl.config_instance.label_filter, device_attrs, hass_state
-                        ):
+                        if entity_id in matching_entity_ids:
                             new_lights.append(light_id)
                         else:
                             LOGGER.debug(
@@ -995,9 +947,7 @@ class HueApiV1Endpoints:
             for light_id in all_lights:
                 group_conf["lights"].append(light_id)
         else:
-            group_conf = await self.ctl.config_instance.async_get_storage_value(
-                "groups", group_id
-            )
+            group_conf = self.ctl.config_instance.get_storage_value("groups", group_id)
         if not group_conf:
             raise RuntimeError("Invalid group id: %s" % group_id)
         return group_conf
@@ -1016,16 +966,7 @@ class HueApiV1Endpoints:
             ]
             for entity_id in area_entities:
                 # Apply label_filter to area entities
-                hass_state = self.ctl.controller_hass.get_entity_state(entity_id)
-                device_id = self.ctl.controller_hass.get_device_id_from_entity_id(entity_id)
-                device_attrs = (
-                    self.ctl.controller_hass.get_device_attributes(device_id)
-                    if device_id
-                    else {}
-                )
-                if not matches_label_filter(
-                    self.ctl.config_instance.label_filter, device_attrs, hass_state
-                ):
+                if not self.__entity_matches_filter(entity_id):
                     continue
                 yield entity_id
 
@@ -1036,23 +977,12 @@ class HueApiV1Endpoints:
                     light_id
                 )
                 # Apply label filter for local group members as well
-                hass_state = self.ctl.controller_hass.get_entity_state(entity_id)
-                device_id = self.ctl.controller_hass.get_device_id_from_entity_id(entity_id)
-                device_attrs = (
-                    self.ctl.controller_hass.get_device_attributes(device_id)
-                    if device_id
-                    else {}
-                )
-                if not matches_label_filter(
-                    self.ctl.config_instance.label_filter, device_attrs, hass_state
-                ):
+                if not self.__entity_matches_filter(entity_id):
                     continue
                 yield entity_id
 
     async def __async_whitelist_to_bridge_config(self) -> dict:
-        whitelist = await self.ctl.config_instance.async_get_storage_value(
-            "users", default={}
-        )
+        whitelist = self.ctl.config_instance.get_storage_value("users", default={})
         whitelist = copy.deepcopy(whitelist)
         for _username, data in whitelist.items():
             del data["username"]
@@ -1078,8 +1008,8 @@ class HueApiV1Endpoints:
                     "linkbutton": self.ctl.config_instance.link_mode_enabled,
                     "ipaddress": self.ctl.config_instance.ip_addr,
                     "gateway": self.ctl.config_instance.ip_addr,
-                    "UTC": datetime.datetime.utcnow().isoformat().split(".")[0],
-                    "localtime": datetime.datetime.now().isoformat().split(".")[0],
+                    "UTC": datetime.datetime.utcnow().isoformat(timespec="seconds"),
+                    "localtime": datetime.datetime.now().isoformat(timespec="seconds"),
                     "timezone": self.ctl.config_instance.get_storage_value(
                         "bridge_config", "timezone", tzlocal.get_localzone_name()
                     ),
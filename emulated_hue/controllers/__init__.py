@@ -13,12 +13,13 @@ async def async_start(
 ) -> Controller:
     """Initialize all controllers."""
     ctl = Controller()
-    ctl.loop = asyncio.get_event_loop()
+    ctl.loop = asyncio.get_running_loop()
     # the HA client is initialized in the async_start because it needs a running loop
     ctl.controller_hass = HomeAssistantController(url=url, token=token)
     ctl.config_instance = Config(
         ctl, data_path, http_port, https_port, use_default_ports
     )
+    await ctl.config_instance.async_setup()
     await ctl.controller_hass.connect()
     return ctl
 
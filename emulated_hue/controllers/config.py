@@ -1,13 +1,17 @@
 """Hold configuration variables for the emulated hue bridge."""
 import asyncio
+import contextlib
 import datetime
+import functools
 import hashlib
-import json                     # needed for the sync write
 import logging
 import os
+import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import orjson
 from getmac import get_mac_address
 
 from emulated_hue.const import (
@@ -41,6 +45,24 @@ MAX_LIGHT_ID = 20          # never let an ID > 19 be created
 HARD_CODED_FILTER = ["ambi"]   # the filter you asked for
 
 
+@functools.lru_cache(maxsize=1)
+def _load_definitions() -> dict:
+    """Load the (read-only) definitions file once and share it between instances."""
+    return load_json(DEFINITIONS_FILE)
+
+
+def _compile_filter_matcher(tokens: tuple[str, ...]) -> Callable[[str], bool]:
+    """Return a callable checking if a lowercased string contains any filter token."""
+    if not tokens:
+        # empty filter permits everything, same as matches_label_filter
+        return lambda value: True
+    if len(tokens) == 1:
+        token = tokens[0]
+        return lambda value: token in value
+    pattern = re.compile("|".join(map(re.escape, tokens)))
+    return lambda value: pattern.search(value) is not None
+
+
 class Config:
     """Hold configuration variables for the emulated hue bridge."""
 
@@ -66,7 +88,8 @@ class Config:
         #  Load persisted JSON files
         # ------------------------------------------------------------------
         self._config = load_json(self.get_path(CONFIG_FILE))
-        self._definitions = load_json(DEFINITIONS_FILE)
+        # digest of the config as last written to disk, see create_save_task
+        self._last_saved_hash: bytes | None = self._config_hash()
         self._link_mode_enabled = False
         self._link_mode_discovery_key = None
 
@@ -90,11 +113,21 @@ class Config:
                     "Are you using a reverse proxy?"
                 )
 
-        mac_addr = str(get_mac_address(ip=self.ip_addr))
-        if not mac_addr or len(mac_addr) < 16:
-            mac_addr = str(get_mac_address())
-        if not mac_addr or len(mac_addr) < 16:
-            mac_addr = "b6:82:d3:45:ac:29"
+        def detect_mac_addr() -> str | None:
+            mac_addr = str(get_mac_address(ip=self.ip_addr))
+            if not mac_addr or len(mac_addr) < 16:
+                mac_addr = str(get_mac_address())
+            if not mac_addr or len(mac_addr) < 16:
+                # not detected, don't cache so the next start tries again
+                return None
+            return mac_addr
+
+        # the (slow) MAC lookup is cached in the config for as long as the IP is unchanged
+        if self.get_storage_value("bridge_config", "ip_addr") != self.ip_addr:
+            bridge_config = self._config.setdefault("bridge_config", {})
+            bridge_config.pop("mac_addr", None)
+            bridge_config["ip_addr"] = self.ip_addr
+        mac_addr = self._cached_or("mac_addr", detect_mac_addr) or "b6:82:d3:45:ac:29"
         self._mac_addr = mac_addr
         mac_str = mac_addr.replace(":", "")
         self._bridge_id = (mac_str[:6] + "FFFE" + mac_str[6:]).upper()
@@ -102,25 +135,45 @@ class Config:
         self._bridge_uid = f"2f402f80-da50-11e1-9b23-{mac_str}"
 
         self._saver_task: asyncio.Task | None = None
+        # set when the in-memory config has changes not yet written to disk
+        self._dirty = False
         self._entertainment_api: EntertainmentAPI | None = None
 
         # ------------------------------------------------------------------
         #  1️⃣  LABEL FILTER – hard‑coded to ["ambi"]
         # ------------------------------------------------------------------
-        self._label_filter: list[str] = parse_label_filter(HARD_CODED_FILTER)
+        self._label_filter: tuple[str, ...] = tuple(
+            parse_label_filter(HARD_CODED_FILTER)
+        )
 
         # Allow a persisted override (kept for backward compatibility).
         persisted = self.get_storage_value("bridge_config", "label_filter", None)
         if persisted and isinstance(persisted, list):
-            self._label_filter = [
-                str(x).strip().lower() for x in persisted if x
-            ]
-
+            # lowercase and dedupe once, keeping the configured order
+            self._label_filter = tuple(
+                dict.fromkeys(str(x).strip().lower() for x in persisted if x)
+            )
+        self._filter_match = _compile_filter_matcher(self._label_filter)
+
+        # entity_id → light_id and area_id → group_id lookups and next free ids,
+        # rebuilt by _prune_and_renumber() and kept in sync on insert.
+        self._entity_to_light_id: dict[str, str] = {}
+        self._area_to_group_id: dict[str, str] = {}
+        self._devicetype_to_user: dict[str, dict] = {}
+        self._next_light_id = 1
+        self._next_group_id = 1
+        self._rebuild_indexes()
+
+    async def async_setup(self) -> None:
+        """Finish initialization, must be awaited once after construction."""
         # ------------------------------------------------------------------
         #  3️⃣  PRUNE / RE‑NUMBER ON STARTUP (guarded)
         # ------------------------------------------------------------------
+        # runs in an executor as it may (synchronously) rewrite the config file
         try:
-            self._prune_and_renumber()
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._prune_and_renumber
+            )
         except Exception as exc:   # pragma: no cover   (should never happen)
             LOGGER.error(
                 "Failed to prune / renumber emulated_hue.json during init: %s",
@@ -132,25 +185,61 @@ class Config:
     #  ── PUBLIC PROPERTIES (unchanged)
     # ----------------------------------------------------------------------
     @property
-    def label_filter(self) -> list[str]:
-        """Return configured label filter as list of lowercase tokens."""
+    def label_filter(self) -> tuple[str, ...]:
+        """Return configured label filter as tuple of lowercase tokens."""
         return self._label_filter
 
+    def _cached_or(self, key: str, producer: Callable[[], Any]) -> Any:
+        """Return a value from bridge_config, storing the result of producer if missing."""
+        value = self.get_storage_value("bridge_config", key)
+        if value is None:
+            value = producer()
+            if value is not None:
+                self._config.setdefault("bridge_config", {})[key] = value
+        return value
+
+    def _serialize_config(self) -> bytes:
+        """Return the config serialized exactly as it is written to disk."""
+        return orjson.dumps(
+            self._config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        )
+
+    def _config_hash(self, payload: bytes | None = None) -> bytes:
+        """Return a digest of the (already serialized) config contents."""
+        if payload is None:
+            payload = self._serialize_config()
+        return hashlib.blake2b(payload, digest_size=8).digest()
+
     async def create_save_task(self) -> None:
         """Create a task to save the config."""
+        # mutations only mark the config dirty, one pending task writes them all
+        self._dirty = True
         if self._saver_task is None or self._saver_task.done():
             self._saver_task = asyncio.create_task(self._commit_config())
 
     async def _commit_config(self, immediate_commit: bool = False) -> None:
         if not immediate_commit:
             await asyncio.sleep(CONFIG_WRITE_DELAY_SECONDS)
-        await async_save_json(self.get_path(CONFIG_FILE), self._config)
+        if not self._dirty:
+            return
+        # serialize once, the same payload is hashed and written
+        payload = self._serialize_config()
+        config_hash = self._config_hash(payload)
+        self._dirty = False
+        if config_hash == self._last_saved_hash:
+            # content identical to what is already on disk
+            return
+        await async_save_json(self.get_path(CONFIG_FILE), payload)
+        self._last_saved_hash = config_hash
 
     async def async_stop(self) -> None:
         """Save the config on shutdown."""
         self.stop_entertainment()
         if self._saver_task is not None and not self._saver_task.done():
             self._saver_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._saver_task
+        if self._dirty:
             await self._commit_config(immediate_commit=True)
 
     @property
@@ -193,11 +282,11 @@ class Config:
         """Return the friendly name for the emulated bridge."""
         return self.get_storage_value("bridge_config", "name", "Hass Emulated Hue")
 
-    @property
+    @functools.cached_property
     def definitions(self) -> dict:
         """Return the definitions dictionary (e.g. bridge sw version)."""
         # TODO: Periodically check for updates of the definitions file on Github ?
-        return self._definitions
+        return _load_definitions()
 
     @property
     def entertainment_active(self) -> bool:
@@ -213,18 +302,17 @@ class Config:
     # ----------------------------------------------------------------------
     async def async_entity_id_to_light_id(self, entity_id: str) -> str:
         """Get a unique light_id number for the hass entity id."""
-        lights = await self.async_get_storage_value("lights", default={})
-        for key, value in lights.items():
-            if entity_id == value["entity_id"]:
-                return key
+        light_id = self._entity_to_light_id.get(entity_id)
+        if light_id is not None:
+            return light_id
+        lights = self.get_storage_value("lights", default={})
 
         # --------------------------------------------------------------
         #  FILTER GUARD – if the entity does NOT contain a filter token,
         #  return the *first* existing light (the dummy) instead of raising.
         # --------------------------------------------------------------
         if self._label_filter:
-            lowered = entity_id.lower()
-            if not any(tok in lowered for tok in self._label_filter):
+            if not self._filter_match(entity_id.lower()):
                 # Choose the smallest numeric key that exists – this will be the
                 # dummy light that _prune_and_renumber() guarantees.
                 if lights:
@@ -244,35 +332,22 @@ class Config:
         # --------------------------------------------------------------
         #  MAX‑ID GUARD – make sure we never exceed the 0‑19 range
         # --------------------------------------------------------------
-        if lights:
-            highest = max(int(k) for k in lights)
-            if highest >= MAX_LIGHT_ID - 1:
-                raise RuntimeError(
-                    f"Maximum allowed light ID ({MAX_LIGHT_ID-1}) already used – "
-                    "cannot create a new light.  Delete an old one or increase MAX_LIGHT_ID."
-                )
+        if self._next_light_id >= MAX_LIGHT_ID:
+            raise RuntimeError(
+                f"Maximum allowed light ID ({MAX_LIGHT_ID-1}) already used – "
+                "cannot create a new light.  Delete an old one or increase MAX_LIGHT_ID."
+            )
 
         # ------------------------------------------------------------------
         #  Existing logic – create a new light entry (unchanged)
         # ------------------------------------------------------------------
-        next_light_id = "1"
-        if lights:
-            next_light_id = str(max(int(k) for k in lights) + 1)
+        next_light_id = str(self._next_light_id)
 
         # generate unique id (fake zigbee address) from entity id
-        unique_hash = hashlib.md5(entity_id.encode()).hexdigest()
+        # (8 address bytes plus a 1 byte suffix, a 9 byte BLAKE2b digest)
+        digest = hashlib.blake2b(entity_id.encode(), digest_size=9).digest()
         # The original format is 00:XX:XX:XX:XX:XX:XX:XX-YY
-        unique_id = "00:{}:{}:{}:{}:{}:{}:{}:{}-{}".format(
-            unique_hash[0:2],
-            unique_hash[2:4],
-            unique_hash[4:6],
-            unique_hash[6:8],
-            unique_hash[8:10],
-            unique_hash[10:12],
-            unique_hash[12:14],
-            unique_hash[14:16],
-            unique_hash[16:18],
-        )
+        unique_id = f"00:{digest[:8].hex(':')}-{digest[8:].hex()}"
         # create default light config
         light_config = {
             "entity_id": entity_id,
@@ -288,11 +363,53 @@ class Config:
             "throttle": DEFAULT_THROTTLE_MS,
         }
         await self.async_set_storage_value("lights", next_light_id, light_config)
+        self._entity_to_light_id[entity_id] = next_light_id
+        self._next_light_id += 1
         return next_light_id
 
     # ----------------------------------------------------------------------
     #  ── 4️⃣  PRUNING / RE‑NUMBERING LOGIC
     # ----------------------------------------------------------------------
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the lookup indexes and id counters from the stored config."""
+        lights: dict = self._config.get("lights", {})
+        self._entity_to_light_id = {
+            conf["entity_id"]: light_id
+            for light_id, conf in lights.items()
+            if "entity_id" in conf
+        }
+        self._next_light_id = max(map(int, lights), default=0) + 1
+        groups: dict = self._config.get("groups", {})
+        self._area_to_group_id = {
+            conf["area_id"]: group_id
+            for group_id, conf in groups.items()
+            if "area_id" in conf
+        }
+        self._next_group_id = max(map(int, groups), default=0) + 1
+        self._devicetype_to_user = {}
+        for user in self._config.get("users", {}).values():
+            # first registration wins, like the former linear search
+            self._devicetype_to_user.setdefault(user["name"], user)
+
+    def _groups_pruned(self, light_ids: frozenset[str]) -> bool:
+        """Return True if the groups are already in the shape pruning leaves them."""
+        groups: dict = self._config.get("groups", {})
+        dummy_room = groups.get("1")
+        if (
+            not dummy_room
+            or dummy_room.get("area_id") != "dummy_room"
+            or len(dummy_room.get("lights", [])) != len(light_ids)
+            or not light_ids.issuperset(dummy_room["lights"])
+        ):
+            return False
+        for grp in groups.values():
+            grp_lights = grp.get("lights", [])
+            if not light_ids.issuperset(grp_lights):
+                return False
+            if not grp_lights and grp.get("type") != "Entertainment":
+                return False
+        return True
+
     def _prune_and_renumber(self) -> None:
         """
         Remove lights that do not contain any token from ``self._label_filter``
@@ -307,32 +424,70 @@ class Config:
         light + dummy room are added so the Hue bridge can still start.
         """
         # ---------- 1️⃣  Helper – does a light match the filter? ----------
-        def keep_light(entity_id: str) -> bool:
-            lowered = entity_id.lower()
-            return any(tok in lowered for tok in self._label_filter)
+        keep_light = self._filter_match
 
-        # ---------- 2️⃣  Prune the ``lights`` dict ----------
+        # ---------- 1️⃣b Fast path – nothing to prune or renumber ----------
+        # The filter hash stored by the last full run tells us every light was
+        # matched against this very filter already; lights added since then
+        # passed the filter guard in async_entity_id_to_light_id.
         old_lights: dict = self._config.get("lights", {})
-        new_lights: dict = {}
-        next_id = 1
-
-        for old_id, light_cfg in old_lights.items():
-            entity = light_cfg.get("entity_id", "")
-            if not keep_light(entity):
-                # skip / drop this light
-                continue
+        light_ids = list(old_lights)
+        filter_hash = hashlib.blake2b(
+            orjson.dumps(self._label_filter), digest_size=8
+        ).hexdigest()
+        if (
+            0 < len(light_ids) <= MAX_LIGHT_ID
+            and light_ids == [str(i) for i in range(1, len(light_ids) + 1)]
+            and self.get_storage_value("_schema", "filter_hash") == filter_hash
+            and self._groups_pruned(frozenset(light_ids))
+            # startup may have changed bridge_config (ip/mac cache) in memory
+            and self._config_hash() == self._last_saved_hash
+        ):
+            LOGGER.debug("Lights and groups already pruned – skipping config rewrite.")
+            self._rebuild_indexes()
+            return
 
-            if next_id > MAX_LIGHT_ID:
-                # safety‑net – stop adding more lights once we hit the cap.
-                LOGGER.warning(
-                    "Reached MAX_LIGHT_ID (%d). Light %s will be omitted.",
-                    MAX_LIGHT_ID,
-                    entity,
-                )
-                continue
+        if self._label_filter:
+            # lowercase every entity_id exactly once and reuse the verdict below
+            matches = {
+                light_id: "entity_id" in cfg and keep_light(cfg["entity_id"].lower())
+                for light_id, cfg in old_lights.items()
+            }
+        else:
+            # empty filter permits all, only renumbering may be needed
+            matches = {
+                light_id: "entity_id" in cfg for light_id, cfg in old_lights.items()
+            }
 
-            new_lights[str(next_id)] = light_cfg
-            next_id += 1
+        # ---------- 2️⃣  Prune the ``lights`` dict ----------
+        # single filtering pass, then number the survivors consecutively
+        # numeric id order, so renumbering never moves "10" in front of "2"
+        kept = sorted(
+            (
+                (light_id, light_cfg)
+                for light_id, light_cfg in old_lights.items()
+                if matches[light_id]
+            ),
+            key=lambda item: int(item[0]),
+        )
+        # safety‑net – stop adding more lights once we hit the cap.
+        for _, light_cfg in kept[MAX_LIGHT_ID:]:
+            LOGGER.warning(
+                "Reached MAX_LIGHT_ID (%d). Light %s will be omitted.",
+                MAX_LIGHT_ID,
+                light_cfg["entity_id"],
+            )
+        new_lights: dict = {}
+        # old light id → new light id, used to rewrite group/scene references
+        old_to_new_light: dict[str, str] = {}
+        for new_id, (old_id, light_cfg) in enumerate(kept[:MAX_LIGHT_ID], start=1):
+            new_lights[str(new_id)] = light_cfg
+            old_to_new_light[old_id] = str(new_id)
+        _remap = old_to_new_light.get
+        # nothing dropped and nothing moved: light references stay valid as-is
+        ids_unchanged = len(old_to_new_light) == len(old_lights) and all(
+            old_id == new_id for old_id, new_id in old_to_new_light.items()
+        )
 
         # ---------- 3️⃣  If we removed everything, create a dummy light ----------
         if not new_lights:
@@ -362,7 +517,6 @@ class Config:
                 },
             }
             new_lights["1"] = dummy_cfg
-            next_id = 2   # next free ID after the dummy
 
         self._config["lights"] = new_lights
         LOGGER.info(
@@ -374,20 +528,25 @@ class Config:
 
         # ---------- 4️⃣  Clean up ``groups`` ----------
         old_groups: dict = self._config.get("groups", {})
-        new_groups: dict = {}
-        kept_ids = set(new_lights.keys())
-
-        for gid, grp in old_groups.items():
-            # Remove any light IDs that no longer exist
-            grp_lights = [lid for lid in grp.get("lights", []) if lid in kept_ids]
-            grp["lights"] = grp_lights
 
-            # Delete the group if it is now empty **and** it is not an
-            # Entertainment group (those groups have a special purpose).
-            if not grp_lights and grp.get("type") != "Entertainment":
-                continue
+        for grp in old_groups.values():
+            # Renumber the lights, dropping any that no longer exist
+            grp["lights"] = [
+                new_lid
+                for lid in grp.get("lights", [])
+                if (new_lid := _remap(lid)) is not None
+            ]
 
-            new_groups[gid] = grp
+        # Delete groups that are now empty **and** not an Entertainment
+        # group (those groups have a special purpose).
+        new_groups: dict = {
+            gid: grp
+            for gid, grp in old_groups.items()
+            if grp["lights"] or grp.get("type") == "Entertainment"
+        }
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            for gid in old_groups.keys() - new_groups.keys():
+                LOGGER.debug("Removing empty group %s", gid)
 
         # ---------- 5️⃣  Ensure a catch‑all room contains ALL lights ----------
         # This group will always be present (ID “1”) and will list every
@@ -399,7 +558,7 @@ class Config:
             "enabled": True,
             "name": "Dummy Room",
             "type": "Room",
-            "lights": list(kept_ids),   # every kept light
+            "lights": list(new_lights),   # every kept light
             "sensors": [],
             "action": {"on": False},
             "state": {"any_on": False, "all_on": False},
@@ -413,16 +572,43 @@ class Config:
             len(new_groups),
         )
 
+        # ---------- 5️⃣b Renumber light references in scenes ----------
+        scenes: dict = {} if ids_unchanged else self._config.get("scenes", {})
+        for scene in scenes.values():
+            if scene.get("lights"):
+                scene["lights"] = [
+                    new_lid
+                    for lid in scene["lights"]
+                    if (new_lid := _remap(lid)) is not None
+                ]
+            if scene.get("lightstates"):
+                scene["lightstates"] = {
+                    new_lid: light_state
+                    for lid, light_state in scene["lightstates"].items()
+                    if (new_lid := _remap(lid)) is not None
+                }
+
+        self._rebuild_indexes()
+
+        # remember which filter this config was pruned with
+        self._config["_schema"] = {"filter_hash": filter_hash}
+
         # ---------- 6️⃣  Persist the cleaned config synchronously ----------
+        # Serialize up front and write to a temp file which atomically replaces
+        # the real one, so a crash mid-write can never leave a truncated config.
         cfg_path = self.get_path(CONFIG_FILE)
+        tmp_path = cfg_path + ".tmp"
         try:
-            with open(cfg_path, "w", encoding="utf-8") as fp:
-                json.dump(self._config, fp, indent=4, sort_keys=False)
+            payload = self._serialize_config()
+            with open(tmp_path, "wb") as fp:
+                fp.write(payload)
+            os.replace(tmp_path, cfg_path)
+            self._last_saved_hash = self._config_hash(payload)
             LOGGER.debug(
                 "Emulated‑Hue config written synchronously after pruning."
             )
         except OSError as err:   # pragma: no cover   (unlikely on a healthy FS)
-            # Propagate the exception so the outer guard in __init__ can log it.
+            # Propagate the exception so the outer guard in async_setup can log it.
             raise
 
     # ----------------------------------------------------------------------
@@ -430,7 +616,7 @@ class Config:
     # ----------------------------------------------------------------------
     async def async_get_light_config(self, light_id: str) -> dict:
         """Return light config for given light id."""
-        conf = await self.async_get_storage_value("lights", light_id)
+        conf = self.get_storage_value("lights", light_id)
         if not conf:
             raise Exception(f"Light {light_id} not found!")
         return conf
@@ -448,14 +634,16 @@ class Config:
 
     async def async_area_id_to_group_id(self, area_id: str) -> str:
         """Get a unique group_id number for the hass area_id."""
-        groups = await self.async_get_storage_value("groups", default={})
-        for key, value in groups.items():
-            if area_id == value.get("area_id"):
-                return key
+        group_id = self._area_to_group_id.get(area_id)
+        if group_id is not None:
+            return group_id
+        groups = self.get_storage_value("groups", default={})
         # group does not yet exist in config, create default config
-        next_group_id = "1"
-        if groups:
-            next_group_id = str(max(int(k) for k in groups) + 1)
+        # (local groups may have claimed ids behind our back, skip those)
+        while str(self._next_group_id) in groups:
+            self._next_group_id += 1
+        next_group_id = str(self._next_group_id)
+        self._next_group_id += 1
         group_config = {
             "area_id": area_id,
             "enabled": True,
@@ -472,27 +660,23 @@ class Config:
 
     async def async_get_group_config(self, group_id: str) -> dict:
         """Return group config for given group id."""
-        conf = await self.async_get_storage_value("groups", group_id)
+        conf = self.get_storage_value("groups", group_id)
         if not conf:
             raise Exception(f"Group {group_id} not found!")
         return conf
 
-    async def async_get_storage_value(
-        self, key: str, subkey: str = None, default: Any | None = None
-    ) -> Any:
-        """Get a value from persistent storage."""
-        return self.get_storage_value(key, subkey, default)
-
     def get_storage_value(
         self, key: str, subkey: str = None, default: Any | None = None
     ) -> Any:
         """Get a value from persistent storage."""
-        main_val = self._config.get(key, None)
-        if main_val is None:
+        if not subkey:
+            main_val = self._config.get(key)
+            return default if main_val is None else main_val
+        try:
+            return self._config[key][subkey]
+        except (KeyError, TypeError):
+            # missing key/subkey or main value is None
             return default
-        if subkey:
-            return main_val.get(subkey, default)
-        return main_val
 
     async def async_set_storage_value(
         self, key: str, subkey: str, value: str | dict
@@ -507,10 +691,18 @@ class Config:
             # new sublevel created
             self._config[key] = {subkey: value}
             needs_save = True
-        elif subkey and self._config[key].get(subkey) != value:
-            # sub key changed
+        elif subkey and (
+            (current := self._config[key].get(subkey)) is value or current != value
+        ):
+            # sub key changed (a stored dict mutated in place compares equal)
             self._config[key][subkey] = value
             needs_save = True
+        if needs_save and key == "groups":
+            # keep the area_id → group_id lookup in sync
+            if subkey is None:
+                self._rebuild_indexes()
+            elif "area_id" in value:
+                self._area_to_group_id[value["area_id"]] = subkey
         # save config to file if changed
         if needs_save:
             await self.create_save_task()
@@ -520,10 +712,16 @@ class Config:
         # if Home Assistant group/area, we just disable it
         if key == "groups" and subkey:
             # when deleting groups, we must delete all associated scenes
-            scenes = await self.async_get_storage_value("scenes", default={})
-            for scene_num, scene_data in scenes.copy().items():
-                if scene_data["group"] == subkey:
-                    await self.async_delete_storage_value("scenes", scene_num)
+            scenes = self.get_storage_value("scenes", default={})
+            scene_nums = [
+                scene_num
+                for scene_num, scene_data in scenes.items()
+                if scene_data["group"] == subkey
+            ]
+            for scene_num in scene_nums:
+                scenes.pop(scene_num)
+            if scene_nums:
+                await self.create_save_task()
             # simply disable the group if its a HASS group
             group_conf = await self.async_get_group_config(subkey)
             if group_conf["class"] == "Home Assistant":
@@ -536,22 +734,43 @@ class Config:
             return await self.async_set_storage_value("lights", subkey, light_conf)
         # all other local storage items
         if subkey:
-            self._config[key].pop(subkey, None)
+            removed = self._config[key].pop(subkey, None)
+            if key == "groups" and removed and "area_id" in removed:
+                self._area_to_group_id.pop(removed["area_id"], None)
+            elif key == "users" and removed:
+                devicetype = removed["name"]
+                indexed = self._devicetype_to_user.get(devicetype)
+                if indexed is not None and indexed.get("username") == subkey:
+                    # fall back to another user registered with this devicetype
+                    replacement = next(
+                        (
+                            user
+                            for user in self._config["users"].values()
+                            if user["name"] == devicetype
+                        ),
+                        None,
+                    )
+                    if replacement is None:
+                        del self._devicetype_to_user[devicetype]
+                    else:
+                        self._devicetype_to_user[devicetype] = replacement
         else:
             self._config.pop(key)
-        await async_save_json(self.get_path(CONFIG_FILE), self._config)
+            if key in ("groups", "users"):
+                self._rebuild_indexes()
+        await self.create_save_task()
         return None
 
     async def async_get_users(self) -> dict:
         """Get all registered users as dict."""
-        return await self.async_get_storage_value("users", default={})
+        return self.get_storage_value("users", default={})
 
     async def async_get_user(self, username: str) -> dict:
         """Get details for given username."""
-        user_data = await self.async_get_storage_value("users", username)
+        user_data = self.get_storage_value("users", username)
         if user_data:
-            user_data["last use date"] = (
-                datetime.datetime.now().isoformat().split(".")[0]
+            user_data["last use date"] = datetime.datetime.now().isoformat(
+                timespec="seconds"
             )
             await self.async_set_storage_value("users", username, user_data)
         return user_data
@@ -560,22 +779,22 @@ class Config:
         """Create a new user for the api access."""
         if not self._link_mode_enabled:
             raise Exception("Link mode not enabled!")
-        all_users = await self.async_get_users()
         # devicetype is used as deviceid: <application_name>#<devicename>
         # return existing user if already registered
-        for item in all_users.values():
-            if item["name"] == devicetype:
-                return item
+        existing = self._devicetype_to_user.get(devicetype)
+        if existing is not None:
+            return existing
         # create username and clientkey
         username = create_secure_string(40)
         clientkey = create_secure_string(32, True).upper()
         user_obj = {
             "name": devicetype,
             "clientkey": clientkey,
-            "create date": datetime.datetime.now().isoformat().split(".")[0],
+            "create date": datetime.datetime.now().isoformat(timespec="seconds"),
             "username": username,
         }
         await self.async_set_storage_value("users", username, user_obj)
+        self._devicetype_to_user[devicetype] = user_obj
         return user_obj
 
     async def delete_user(self, username: str) -> None:
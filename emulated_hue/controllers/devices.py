@@ -1,5 +1,6 @@
 """Collection of devices controllable by Hue."""
 import asyncio
+import dataclasses
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -168,7 +169,7 @@ class OnOffDevice:
         asyncio.create_task(self._async_save_config())
 
     async def _async_update_config_states(
-        self, control_state: EntityState | None = None
+        self, control_state: EntityState | None = None, save: bool = True
     ) -> None:
         """Update config states."""
         for state in ALL_STATES:
@@ -179,10 +180,13 @@ class OnOffDevice:
                 best_value = getattr(self._hass_state, state)
             else:
                 best_value = self._config.get("state", {}).get(state, None)
+                if isinstance(best_value, list):
+                    best_value = tuple(best_value)
             setattr(self._config_state, state, best_value)
 
-        self._config["state"] = dict(self._config_state)
-        await self._async_save_config()
+        self._config["state"] = dataclasses.asdict(self._config_state)
+        if save:
+            await self._async_save_config()
 
     def _update_device_state(
         self, existing_state: EntityState | None = None
@@ -298,13 +302,26 @@ class OnOffDevice:
             self._hass_state = self._update_device_state()
             await self._async_update_config_states()
 
-    async def async_execute(self, control_state: EntityState) -> None:
-        """Execute control state."""
+    async def async_should_execute(self, control_state: EntityState) -> bool:
+        """Return if the control state changes the device and is not throttled."""
         if not control_state:
             LOGGER.warning("No state to execute for device %s", self._entity_id)
-            return
+            return False
+        return await self._async_update_allowed(control_state)
+
+    async def async_commit_state(
+        self, control_state: EntityState, save: bool = True
+    ) -> None:
+        """Record an executed control state, saving it unless save is False."""
+        await self._async_update_config_states(control_state, save)
 
-        if not await self._async_update_allowed(control_state):
+    async def async_save_state(self) -> None:
+        """Save the current state to the config."""
+        await self._async_save_config()
+
+    async def async_execute(self, control_state: EntityState) -> None:
+        """Execute control state."""
+        if not await self.async_should_execute(control_state):
             return
         if control_state.power_state:
             await self.ctl.controller_hass.async_turn_on(
@@ -312,7 +329,7 @@ class OnOffDevice:
             )
         else:
             await self.ctl.controller_hass.async_turn_off(self._entity_id)
-        await self._async_update_config_states(control_state)
+        await self.async_commit_state(control_state)
 
 
 class BrightnessDevice(OnOffDevice):
@@ -446,27 +463,10 @@ class RGBDevice(BrightnessDevice):
             """
             Set hue and saturation colors.
 
-            The Hue client sends values in the *Hue* range
-            (hue 0‑65535, sat 0‑254). Home Assistant expects
-            hue in degrees (0‑360) and saturation as a percent
-            (0‑100). We therefore convert *down* before storing the
-            command in the control state.
+            Values are in Home Assistant ranges (hue 0-360, sat 0-100); the
+            API layer converts from the Hue ranges before calling this.
             """
-            # -----------------------------------------------------------------
-            # Down‑scale from Hue range → Home‑Assistant range
-            # -----------------------------------------------------------------
-            # Hue → degrees (0‑359). 65535 should map to 359, not 360.
-            #hue_ha = int(round((hue * 359) / 65535))
-            # Saturation → percent (0‑100)
-            #sat_ha = int(round((sat * 100) / 254))
-
-            # -----------------------------------------------------------------
-            # Defensive clamping – never exceed HA limits
-            # -----------------------------------------------------------------
-            hue_ha = max(0, min(hue, 360))
-            sat_ha = max(0, min(sat, 100))
-
-            self._control_state.hue_saturation = (hue_ha, sat_ha)
+            self._control_state.set_hue_saturation((hue, sat))
             self._control_state.color_mode = const.HASS_COLOR_MODE_HS
 
         def set_xy(self, x: float, y: float) -> None:
@@ -500,15 +500,12 @@ class RGBDevice(BrightnessDevice):
     ) -> EntityState:
         """Update EntityState object."""
         existing_state = super()._update_device_state(existing_state)
-        existing_state.hue_saturation = self._hass_state_dict.get(
-            const.HASS_ATTR, {}
-        ).get(const.HASS_ATTR_HS_COLOR)
-        existing_state.xy_color = self._hass_state_dict.get(const.HASS_ATTR, {}).get(
-            const.HASS_ATTR_XY_COLOR
-        )
-        existing_state.rgb_color = self._hass_state_dict.get(const.HASS_ATTR, {}).get(
-            const.HASS_ATTR_RGB_COLOR
-        )
+        attributes = self._hass_state_dict.get(const.HASS_ATTR, {})
+        existing_state.set_hue_saturation(attributes.get(const.HASS_ATTR_HS_COLOR))
+        xy_color = attributes.get(const.HASS_ATTR_XY_COLOR)
+        existing_state.xy_color = tuple(xy_color) if xy_color else None
+        rgb_color = attributes.get(const.HASS_ATTR_RGB_COLOR)
+        existing_state.rgb_color = tuple(rgb_color) if rgb_color else None
         existing_state.color_mode = self._hass_state_dict.get(const.HASS_ATTR, {}).get(
             const.HASS_COLOR_MODE
         )
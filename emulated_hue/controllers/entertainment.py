@@ -3,15 +3,34 @@
 import asyncio
 import logging
 import os
+import struct
+from collections import defaultdict
 
-from emulated_hue.controllers.devices import async_get_device
-from .models import Controller
+from emulated_hue.controllers.devices import OnOffDevice, async_get_device
+from .models import Controller, EntityState
 
 LOGGER = logging.getLogger(__name__)
 
 COLOR_TYPE_RGB = "RGB"
 COLOR_TYPE_XY_BR = "XY Brightness"
 HASS_SENSOR = "binary_sensor.emulated_hue_entertainment_active"
+# 9 byte light channel: device type, light id, three 16-bit colour values
+LIGHT_CHANNEL = struct.Struct(">xHHHH")
+# protocol major version (byte 9) and colour space (byte 14) of the header
+PACKET_HEADER = struct.Struct(">BxxxxB")
+# identical frames for a light within this many seconds are not sent again
+DUPLICATE_FRAME_INTERVAL = 0.04
+# packet layout (taken from the Hue spec)
+PKT_HEADER_BEGIN_SIZE = 9  # "HueStream"
+PKT_HEADER_PROTOCOL_SIZE = 7  # protocol version, sequence, etc.
+PKT_HEADER_UUID_SIZE = 36
+PKT_LIGHT_DATA_SIZE = 9 * 20  # max 20 channels, 9 bytes each
+MAX_PKT_SIZE = (
+    PKT_HEADER_BEGIN_SIZE
+    + PKT_HEADER_PROTOCOL_SIZE
+    + PKT_HEADER_UUID_SIZE
+    + PKT_LIGHT_DATA_SIZE
+)
 
 
 # ----------------------------------------------------------------------
@@ -25,12 +44,6 @@ else:
     OPENSSL_BIN = "openssl"
 
 
-def chunked(size, source):
-    """Yield successive chunks of ``size`` bytes from ``source``."""
-    for i in range(0, len(source), size):
-        yield source[i: i + size]
-
-
 class EntertainmentAPI:
     """Handle UDP socket for HUE Entertainment (streaming mode)."""
 
@@ -42,28 +55,16 @@ class EntertainmentAPI:
         self._socket_daemon = None
         self._timestamps = {}
         self._prev_data = {}
+        # light_id → device, stable for the streaming session
+        self._light_cache: dict[int, OnOffDevice] = {}
+        # colour handling is specialised per colour space, a property of the
+        # streaming group that rarely changes between packets
+        self._color_space = COLOR_TYPE_RGB
+        self._parse_light = self._parse_light_rgb
         self._user_details = user_details
         # start the background task that reads the DTLS stream
         self.ctl.loop.create_task(self.async_run())
 
-        # --------------------------------------------------------------
-        #  Packet layout constants (taken from the Hue spec)
-        # --------------------------------------------------------------
-        self._pkt_header_begin_size = 9      # “HueStream”
-        self._pkt_header_protocol_size = 7   # protocol version, sequence, etc.
-        self._pkt_header_uuid_size = 36
-        self._pkt_light_data_size = 9 * 20   # max 20 channels, 9 bytes each
-        self._max_pkt_size = (
-            self._pkt_header_begin_size
-            + self._pkt_header_protocol_size
-            + self._pkt_header_uuid_size
-            + self._pkt_light_data_size
-        )
-
-        num_lights = len(self.group_details["lights"])
-        # typical packet size for the current group (will be adjusted on‑the‑fly)
-        self._likely_pktsize = 16 + (9 * num_lights)
-
     # ----------------------------------------------------------------------
     #  Main loop – reads DTLS packets from the OpenSSL subprocess
     # ----------------------------------------------------------------------
@@ -95,34 +96,32 @@ class EntertainmentAPI:
             *args,
             stdout=asyncio.subprocess.PIPE,
             stdin=asyncio.subprocess.PIPE,
-            limit=self._max_pkt_size,
+            # one packet body plus the next delimiter must fit the read buffer
+            limit=MAX_PKT_SIZE + PKT_HEADER_BEGIN_SIZE,
         )
 
-        buffer = b""
-        while not self._interrupted:
-            # --------------------------------------------------------------
-            #  Keep the buffer from growing without bound – we only need
-            #  at most two full packets (header + payload) at any time.
-            # --------------------------------------------------------------
-            buffer = buffer[
-                -((self._max_pkt_size + self._pkt_header_begin_size) * 2) :
-            ]
-
-            # read the next chunk; the size guess is updated after each packet
-            buffer += await self._socket_daemon.stdout.read(self._likely_pktsize)
-
-            # packets are delimited by the literal string “HueStream”
-            pkts = buffer.split(b"HueStream")
-            if len(pkts) > 1:
-                pkt = None
-                for pkt in pkts[:-1]:
-                    pkt = b"HueStream" + pkt
-                    await self.__process_packet(pkt)
-                buffer = pkts[-1]
-
-                # adjust the next read size to match the real packet length
-                if (guess := len(pkt) - len(buffer)) > 0:
-                    self._likely_pktsize = guess
+        # packets are delimited by the literal string "HueStream", so every
+        # read up to the next delimiter yields exactly one packet body;
+        # anything before the first delimiter is not a complete packet
+        stdout = self._socket_daemon.stdout
+        synced = False
+        try:
+            while not self._interrupted:
+                try:
+                    chunk = await stdout.readuntil(b"HueStream")
+                except asyncio.LimitOverrunError as err:
+                    # garbage without a delimiter, drop it and resync
+                    await stdout.readexactly(err.consumed)
+                    synced = False
+                    continue
+                if synced:
+                    await self.__process_packet(
+                        b"HueStream" + chunk[:-PKT_HEADER_BEGIN_SIZE]
+                    )
+                synced = True
+        except asyncio.IncompleteReadError:
+            # the OpenSSL process exited (e.g. stopped by us)
+            pass
 
     # ----------------------------------------------------------------------
     #  Graceful shutdown
@@ -132,69 +131,136 @@ class EntertainmentAPI:
         self._interrupted = True
         if self._socket_daemon:
             self._socket_daemon.kill()
+        # streamed states are only kept in memory, save them once now
+        self.ctl.loop.create_task(
+            self.__async_save_light_states(list(self._light_cache.values()))
+        )
+        self._light_cache.clear()
         self.ctl.loop.create_task(
             self.ctl.controller_hass.set_state(HASS_SENSOR, "off")
         )
         LOGGER.info("HUE Entertainment Service stopped.")
 
+    @staticmethod
+    async def __async_save_light_states(devices: list[OnOffDevice]) -> None:
+        """Save the last streamed state of each light."""
+        for device in devices:
+            await device.async_save_state()
+
     # ----------------------------------------------------------------------
     #  Packet handling
     # ----------------------------------------------------------------------
     async def __process_packet(self, packet: bytes) -> None:
         """Validate the packet header and dispatch per‑light data."""
         # ignore any packet that does not contain the minimal header
-        if len(packet) < self._pkt_header_begin_size + self._pkt_header_protocol_size:
+        if len(packet) < PKT_HEADER_BEGIN_SIZE + PKT_HEADER_PROTOCOL_SIZE:
             return
 
-        version = packet[9]
+        version, color_space_id = PACKET_HEADER.unpack_from(packet, 9)
         # colour space: 0 → RGB, anything else → XY‑Brightness
-        color_space = COLOR_TYPE_RGB if packet[14] == 0 else COLOR_TYPE_XY_BR
+        color_space = COLOR_TYPE_RGB if color_space_id == 0 else COLOR_TYPE_XY_BR
+        if color_space != self._color_space:
+            self._color_space = color_space
+            self._parse_light = (
+                self._parse_light_xy
+                if color_space == COLOR_TYPE_XY_BR
+                else self._parse_light_rgb
+            )
 
         # version 1: payload starts at byte 16, version 2: at byte 52
-        lights_data = packet[16:] if version == 1 else packet[52:]
+        # (zero-copy view); a payload that is not whole channels is malformed
+        lights_data = memoryview(packet)[16 if version == 1 else 52 :]
+        if len(lights_data) % 9:
+            LOGGER.debug("Dropping malformed entertainment packet")
+            return
+
+        # decode all channels in one pass; the per-light work is small,
+        # awaiting in turn avoids a task per light
+        calls = []
+        for channel in LIGHT_CHANNEL.iter_unpack(lights_data):
+            call = await self.__async_process_light_packet(*channel, color_space)
+            if call is not None:
+                calls.append(call)
+        if calls:
+            await self.__async_execute_calls(calls)
 
-        tasks = []
-        for light_data in chunked(9, lights_data):
-            tasks.append(self.__async_process_light_packet(light_data, color_space))
-        await asyncio.gather(*tasks)
+    async def __async_execute_calls(
+        self, calls: list[tuple[OnOffDevice, EntityState]]
+    ) -> None:
+        """Send changed lights to Home Assistant, one call per identical payload."""
+        batches: dict[tuple, list] = defaultdict(list)
+        for device, control_state in calls:
+            if await device.async_should_execute(control_state):
+                payload = tuple(control_state.to_hass_data().items())
+                batches[payload].append((device, control_state))
 
-    async def __async_process_light_packet(self, light_data, color_space):
-        """Translate a single 9‑byte channel into Home Assistant service calls."""
-        # --------------------------------------------------------------
-        #  Correctly decode the 16‑bit light identifier (big‑endian)
-        # --------------------------------------------------------------
-        light_id = str((light_data[1] << 8) | light_data[2])
+        for payload, batch in batches.items():
+            await self.ctl.controller_hass.async_turn_on(
+                [device.entity_id for device, _ in batch], dict(payload)
+            )
+            # keep frames out of the config file, stop() saves the final state
+            for device, control_state in batch:
+                await device.async_commit_state(control_state, save=False)
+
+    async def __async_process_light_packet(
+        self, light_id: int, value1: int, value2: int, value3: int, color_space: str
+    ) -> tuple[OnOffDevice, EntityState] | None:
+        """Translate a single 9-byte channel into a control state for its device."""
+        # the stream repeats frames at up to 50Hz, drop unchanged ones early
+        frame = (color_space, value1, value2, value3)
+        now = self.ctl.loop.time()
+        if (
+            self._prev_data.get(light_id) == frame
+            and now - self._timestamps.get(light_id, 0.0) < DUPLICATE_FRAME_INTERVAL
+        ):
+            return None
+        self._prev_data[light_id] = frame
+        self._timestamps[light_id] = now
 
         # Retrieve the light configuration (entity_id, etc.) from the bridge config
-        light_conf = await self.ctl.config_instance.async_get_light_config(light_id)
+        # and the matching device, once per light and streaming session
+        device = self._light_cache.get(light_id)
+        if device is None:
+            light_conf = await self.ctl.config_instance.async_get_light_config(
+                str(light_id)
+            )
+            device = await async_get_device(self.ctl, light_conf["entity_id"])
+            self._light_cache[light_id] = device
 
         # ------------------------------------------------------------------
         #  Build a control state object and populate it with the streamed data
         # ------------------------------------------------------------------
-        entity_id = light_conf["entity_id"]
-        device = await async_get_device(self.ctl, entity_id)
         call = device.new_control_state()
         call.set_power_state(True)
 
-        if color_space == COLOR_TYPE_RGB:
-            # Each colour component is a 16‑bit value; dividing by 256 brings it
-            # into the 0‑255 range expected by Home Assistant.
-            red   = int((light_data[3] * 256 + light_data[4]) / 256)
-            green = int((light_data[5] * 256 + light_data[6]) / 256)
-            blue  = int((light_data[7] * 256 + light_data[8]) / 256)
-
-            call.set_rgb(red, green, blue)
-            # Approximate brightness as the average of the three channels.
-            call.set_brightness(int(sum(call.control_state.rgb_color) / 3))
-        else:   # XY‑Brightness mode
-            # Convert the 16‑bit XY values into the 0‑1 float range HA expects.
-            x = float((light_data[3] * 256 + light_data[4]) / 65535)
-            y = float((light_data[5] * 256 + light_data[6]) / 65535)
-
-            call.set_xy(x, y)
-            # Brightness is the last two bytes (0‑65535 → 0‑255 after division).
-            call.set_brightness(int((light_data[7] * 256 + light_data[8]) / 256))
+        self._parse_light(call, value1, value2, value3)
 
         # No transition – the light should follow the stream instantly.
         call.set_transition_ms(0, respect_throttle=True)
-        await call.async_execute()
\ No newline at end of file
+        return device, call.control_state
+
+    @staticmethod
+    def _parse_light_rgb(call, value1: int, value2: int, value3: int) -> None:
+        """Apply an RGB channel to a control state."""
+        # Each colour component is a 16‑bit value; dropping the low byte brings it
+        # into the 0‑255 range expected by Home Assistant.
+        red = value1 >> 8
+        green = value2 >> 8
+        blue = value3 >> 8
+        # Approximate brightness as the average of the three channels, taken
+        # from the locals rather than read back from the control state.
+        brightness = (red + green + blue) // 3
+
+        call.set_brightness(brightness)
+        call.set_rgb(red, green, blue)
+
+    @staticmethod
+    def _parse_light_xy(call, value1: int, value2: int, value3: int) -> None:
+        """Apply an XY-Brightness channel to a control state."""
+        # Convert the 16‑bit XY values into the 0‑1 float range HA expects.
+        x = value1 / 65535.0
+        y = value2 / 65535.0
+
+        call.set_xy(x, y)
+        # Brightness is the last two bytes (0‑65535 → 0‑255 after the shift).
+        call.set_brightness(value3 >> 8)
@@ -30,11 +30,11 @@ class HomeAssistantController(HomeAssistantClient):
         data = {HASS_ATTR_ENTITY_ID: entity_id}
         await self.call_service(HASS_DOMAIN_HOMEASSISTANT, HASS_SERVICE_TURN_OFF, data)
 
-    async def async_turn_on(self, entity_id: str, data: dict) -> None:
+    async def async_turn_on(self, entity_id: str | list[str], data: dict) -> None:
         """
-        Turn on a generic entity in Home Assistant.
+        Turn on one or more generic entities in Home Assistant.
 
-            :param entity_id: The ID of the entity.
+            :param entity_id: The ID of the entity, or a list of IDs.
             :param data: The service data.
         """
         data[HASS_ATTR_ENTITY_ID] = entity_id
@@ -1,14 +1,9 @@
 """Device state model."""
 import asyncio
+import dataclasses
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-# ------------------------------------------------------------
-# NOTE: we now import ``field_validator`` so we can coerce
-# hue/saturation values that Home Assistant returns as floats.
-# ------------------------------------------------------------
-from pydantic import BaseModel, field_validator
-
 from emulated_hue import const
 
 from .homeassistant import HomeAssistantController
@@ -18,6 +13,14 @@ if TYPE_CHECKING:
 else:
     Config = "Config"
 
+# color mode -> (Home Assistant attribute, EntityState attribute)
+_COLOR_MODE_MAP: dict[str, tuple[str, str]] = {
+    const.HASS_COLOR_MODE_COLOR_TEMP: (const.HASS_ATTR_COLOR_TEMP, "color_temp"),
+    const.HASS_COLOR_MODE_HS: (const.HASS_ATTR_HS_COLOR, "hue_saturation"),
+    const.HASS_COLOR_MODE_XY: (const.HASS_ATTR_XY_COLOR, "xy_color"),
+    const.HASS_COLOR_MODE_RGB: (const.HASS_ATTR_RGB_COLOR, "rgb_color"),
+}
+
 
 @dataclass
 class Controller:
@@ -30,7 +33,8 @@ class Controller:
     loop: asyncio.AbstractEventLoop | None = None
 
 
-class EntityState(BaseModel):
+@dataclass(slots=True)
+class EntityState:
     """Store device state."""
 
     power_state: bool = True
@@ -39,11 +43,9 @@ class EntityState(BaseModel):
     brightness: int | None = None
     color_temp: int | None = None
 
-    # --------------------------------------------------------
-    # Hue‑saturation may come from HA as floats (e.g. 27.152)
-    # The Hue API expects integers, so we accept floats here and
-    # coerce them to ints with a validator (see below).
-    # --------------------------------------------------------
+    # Hue/saturation use Home Assistant ranges (0-360 / 0-100); the API
+    # layer scales to and from the Hue ranges. Kept clamped by
+    # set_hue_saturation().
     hue_saturation: tuple[int | float, int | float] | None = None
 
     xy_color: tuple[float, float] | None = None
@@ -52,77 +54,50 @@ class EntityState(BaseModel):
     effect: str | None = None
     color_mode: str | None = None
 
-    # -----------------------------------------------------------------
-    # NEW: validator that guarantees integer hue & saturation **and**
-    # scales HA's 0‑360 / 0‑100 ranges to Hue's 0‑65535 / 0‑254 ranges.
-    # -----------------------------------------------------------------
-    @field_validator("hue_saturation")
-    @classmethod
-    def _coerce_hue_sat(
-        cls, v: tuple[int | float, int | float] | None
-    ) -> tuple[int, int] | None:
-        """
-        Home‑Assistant reports hue/saturation as floats:
-          * hue  : 0‑360 ° (or 0‑65535 if the integration already scaled it)
-          * sat  : 0‑100 % (or 0‑254 if already scaled)
-
-        The Hue API expects **integers** in the ranges:
-          * hue  : 0‑65535
-          * sat  : 0‑254
-
-        This validator:
-          1. Detects whether the incoming numbers are already in the Hue range
-             (>= 360 for hue or >= 254 for sat). If they are, we simply round.
-          2. Otherwise we scale:
-                hue_int = round(hue * 65535 / 360)
-                sat_int = round(sat * 254 / 100)
-        """
-        if v is None:
-            return v
-
-        hue, sat = v
-
-        # If the values look already scaled for Hue, just round them.
-        #if hue >= 360 or sat >= 254:
-        #    return (int(round(hue)), int(round(sat)))
-
-        # Normal HA ranges – scale to Hue ranges.
-        #hue_int = int(round((hue * 65535) / 360))
-        #sat_int = int(round((sat * 254) / 100))
-
-        # Clamp just in case Home Assistant ever returns something out of bounds.
-        hue_int = max(0, min(hue, 360))
-        sat_int = max(0, min(sat, 100))
-        return (hue_int, sat_int)
-
-    # -----------------------------------------------------------------
+    def __post_init__(self) -> None:
+        """Normalise JSON lists from config or Home Assistant to tuples."""
+        self.set_hue_saturation(self.hue_saturation)
+        if self.xy_color is not None:
+            self.xy_color = tuple(self.xy_color)
+        if self.rgb_color is not None:
+            self.rgb_color = tuple(self.rgb_color)
+
+    def set_hue_saturation(
+        self, value: tuple[int | float, int | float] | list | None
+    ) -> None:
+        """Set hue/saturation, clamped to Home Assistant's 0-360/0-100 ranges."""
+        if value is None:
+            self.hue_saturation = None
+            return
+        hue, sat = value
+        self.hue_saturation = (
+            360 if hue > 360 else 0 if hue < 0 else hue,
+            100 if sat > 100 else 0 if sat < 0 else sat,
+        )
 
     def __eq__(self, other):
         """Compare states."""
-        other: EntityState = other
-        power_state_equal = self.power_state == other.power_state
-        brightness_equal = self.brightness == other.brightness
-        color_attribute = (
-            self._get_color_mode_attribute() == other._get_color_mode_attribute()
+        if other is self:
+            return True
+        if type(other) is not EntityState:
+            return NotImplemented
+        return (
+            self.brightness,
+            self.power_state,
+            self._get_color_mode_attribute(),
+        ) == (
+            other.brightness,
+            other.power_state,
+            other._get_color_mode_attribute(),
         )
-        return power_state_equal and brightness_equal and color_attribute
-
-    class Config:
-        """Pydantic config."""
-
-        validate_assignment = True
 
     def _get_color_mode_attribute(self) -> tuple[str, Any] | None:
         """Return color mode and attribute associated."""
-        if self.color_mode == const.HASS_COLOR_MODE_COLOR_TEMP:
-            return const.HASS_ATTR_COLOR_TEMP, self.color_temp
-        elif self.color_mode == const.HASS_COLOR_MODE_HS:
-            return const.HASS_ATTR_HS_COLOR, self.hue_saturation
-        elif self.color_mode == const.HASS_COLOR_MODE_XY:
-            return const.HASS_ATTR_XY_COLOR, self.xy_color
-        elif self.color_mode == const.HASS_COLOR_MODE_RGB:
-            return const.HASS_ATTR_RGB_COLOR, self.rgb_color
-        return None
+        entry = _COLOR_MODE_MAP.get(self.color_mode)
+        if entry is None:
+            return None
+        hass_attr, state_attr = entry
+        return hass_attr, getattr(self, state_attr)
 
     def to_hass_data(self) -> dict:
         """Convert to Hass data."""
@@ -150,16 +125,8 @@ class EntityState(BaseModel):
         if not states:
             return EntityState()
 
-        save_state = {}
-        # Hinweis: 'vars(cls).get("__fields__")' ist Pydantic V1 Syntax.
-        # Falls du komplett auf V2 migrierst, wäre 'cls.model_fields' korrekter.
-        # Ich habe die Logik hier konservativ behalten, aber den Bug in der if-Condition gefixt.
-        fields = vars(cls).get("__fields__") or cls.model_fields
-
-        for state in list(fields):
-            if state in states:
-                save_state[state] = states[state]
-        return EntityState(**save_state)
+        return EntityState(**{k: states[k] for k in _ALL_STATES_SET & states.keys()})
 
 
-ALL_STATES: list = list(EntityState.model_fields.keys())
\ No newline at end of file
+ALL_STATES: list = [field.name for field in dataclasses.fields(EntityState)]
+_ALL_STATES_SET: frozenset[str] = frozenset(ALL_STATES)
\ No newline at end of file
@@ -1,8 +1,8 @@
 """Scheduler for emulated_hue."""
 import asyncio
 import inspect
+import itertools
 from collections.abc import Awaitable, Callable
-from typing import Any
 
 # ----------------------------------------------------------------------
 #  Internal storage: map a numeric schedule‑id → the asyncio.Task that runs it
@@ -10,6 +10,7 @@ from typing import Any
 # NOTE: The original code used ``dict[int : asyncio.Task]`` which is invalid
 # Python syntax.  The correct generic syntax is ``dict[int, asyncio.Task]``.
 _schedules: dict[int, asyncio.Task] = {}
+_next_id = itertools.count(1)
 
 
 def _async_scheduler_factory(
@@ -17,32 +18,21 @@ def _async_scheduler_factory(
 ) -> Awaitable[None]:
     """Create a coroutine that runs an async ``func`` every ``interval_ms``."""
     async def scheduler_func():
+        # sleep until a fixed deadline so the run time of func() doesn't add
+        # up to drift; resync if a run overshoots the next deadline
+        loop = asyncio.get_running_loop()
+        period = interval_ms / 1000
+        deadline = loop.time() + period
         while True:
-            await asyncio.sleep(interval_ms / 1000)
+            await asyncio.sleep(max(0, deadline - loop.time()))
             await func()
+            deadline += period
+            if deadline < loop.time():
+                deadline = loop.time() + period
 
     return scheduler_func()
 
 
-def _scheduler_factory(func: Callable[[], None], interval_ms: int) -> Awaitable[None]:
-    """Create a coroutine that runs a sync ``func`` every ``interval_ms``."""
-    async def scheduler_func():
-        while True:
-            await asyncio.sleep(interval_ms / 1000)
-            func()
-
-    return scheduler_func()
-
-
-def _is_async_function(
-    func: Callable[[Any], None] | Callable[[Any], Awaitable[None]]
-) -> bool:
-    """Return ``True`` if ``func`` is a coroutine function or async generator."""
-    is_async_gen = inspect.isasyncgenfunction(func)
-    is_coro_fn = asyncio.iscoroutinefunction(func)
-    return is_async_gen or is_coro_fn
-
-
 def add_scheduler(
     func: Callable[[], None] | Callable[[], Awaitable[None]], interval_ms: int
 ) -> int:
@@ -55,11 +45,16 @@ def add_scheduler(
     Returns a numeric scheduler‑id that can later be used with
     :func:`remove_scheduler`.
     """
-    next_id = max(_schedules.keys()) + 1 if _schedules else 1
-    if _is_async_function(func):
-        task = asyncio.create_task(_async_scheduler_factory(func, interval_ms))
-    else:
-        task = asyncio.create_task(_scheduler_factory(func, interval_ms))
+    next_id = next(_next_id)
+    async_func = func
+    if not inspect.iscoroutinefunction(func):
+
+        async def _async_run_sync() -> None:
+            func()
+
+        async_func = _async_run_sync
+
+    task = asyncio.create_task(_async_scheduler_factory(async_func, interval_ms))
     _schedules[next_id] = task
     return next_id
 
@@ -79,5 +74,7 @@ def remove_all_schedulers() -> None:
 
 
 async def async_stop() -> None:
-    """Convenient async wrapper – stops all schedulers."""
-    remove_all_schedulers()
\ No newline at end of file
+    """Cancel all schedulers and wait for them to finish."""
+    tasks = list(_schedules.values())
+    remove_all_schedulers()
+    await asyncio.gather(*tasks, return_exceptions=True)
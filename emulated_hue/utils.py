@@ -1,5 +1,6 @@
 """Emulated HUE Bridge for HomeAssistant - Helper utils."""
 import asyncio
+import contextlib
 import inspect
 import json
 import logging
@@ -8,9 +9,11 @@ import random
 import re
 import socket
 import string
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
 from typing import Any, Mapping, Sequence
 
+import orjson
 import slugify as unicode_slug
 from aiohttp import web
 
@@ -28,6 +31,10 @@ LOCAL_NETWORKS = (
     ip_network("192.168.0.0/16"),
 )
 
+# JSON files are written by a single dedicated worker: writes are serialized and
+# never wait behind (or block) other jobs queued on the loop's default executor.
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save_json")
+
 
 def wrap_number(value: float, start_value: float, max_value: float) -> float:
     """Wrap a number between start and end value."""
@@ -282,29 +289,37 @@ def send_error_response(address: str, description: str, type_num: int) -> web.Re
 def load_json(filename: str) -> dict:
     """Load JSON from file."""
     try:
-        with open(filename, encoding="utf-8") as fdesc:
-            return json.loads(fdesc.read())  # type: ignore
+        with open(filename, "rb") as fdesc:
+            return orjson.loads(fdesc.read())  # type: ignore
     except (FileNotFoundError, ValueError, OSError) as error:
         LOGGER.debug("Loading %s failed: %s", filename, error)
         return {}
 
 
-async def async_save_json(filename: str, data: dict):
-    """Save JSON data to a file."""
+async def async_save_json(filename: str, data: dict | bytes):
+    """Save JSON data (or an already serialized JSON payload) to a file."""
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, save_json, filename, data)
+    return await loop.run_in_executor(_SAVE_EXECUTOR, save_json, filename, data)
 
 
-def save_json(filename: str, data: dict):
-    """Save JSON data to a file."""
+def save_json(filename: str, data: dict | bytes):
+    """Save JSON data (or an already serialized JSON payload) to a file."""
     safe_copy = filename + ".backup"
-    if os.path.isfile(filename):
-        os.replace(filename, safe_copy)
+    tmp_file = filename + ".tmp"
     try:
-        json_data = json.dumps(data, sort_keys=True, indent=4, ensure_ascii=False)
-        with open(filename, "w") as file_obj:
+        if isinstance(data, bytes):
+            json_data = data
+        else:
+            json_data = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+        # write aside first so a failed write never truncates the real file
+        with open(tmp_file, "wb") as file_obj:
             file_obj.write(json_data)
-    except OSError:
+        with contextlib.suppress(FileNotFoundError):
+            os.replace(filename, safe_copy)
+        os.replace(tmp_file, filename)
+    except (OSError, orjson.JSONEncodeError):
         LOGGER.exception("Failed to serialize to JSON: %s", filename)
 
 